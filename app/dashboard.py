@@ -6,8 +6,6 @@ Run with: streamlit run app/dashboard.py
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 import sys
 sys.path.append('..')
 
@@ -24,6 +22,18 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+
+@st.cache_data(show_spinner=False)
+def _cached_metrics(lambda_rate, mu_rate, c):
+    return MMcQueue(lambda_rate, mu_rate, c).calculate_metrics()
+
+
+@st.cache_data(show_spinner=False)
+def _cached_optimize(lambda_rate, mu_rate, cost_server, cost_waiting, c_min, c_max):
+    optimizer = CostOptimizer(lambda_rate, mu_rate, cost_server, cost_waiting)
+    return optimizer.optimize(c_min=c_min, c_max=c_max)
+
+
 st.markdown('<h1 style="text-align: center; color: #1f77b4;">🚀 Queue Theory Analysis Dashboard</h1>', unsafe_allow_html=True)
 st.markdown("**Interactive M/M/c Queue Modeling and Optimization**")
 st.markdown("---")
@@ -61,8 +71,7 @@ with tab2:
     st.header("M/M/c Queue Analysis")
     c_selected = st.slider("Number of Servers (c)", min_value=c_min, max_value=c_max, value=c_min + 2, step=1)
     try:
-        queue = MMcQueue(lambda_rate, mu_rate, c_selected)
-        metrics = queue.calculate_metrics()
+        metrics = _cached_metrics(lambda_rate, mu_rate, c_selected)
         col1, col2, col3, col4, col5 = st.columns(5)
         with col1:
             st.metric("Utilization (ρ)", f"{metrics['utilization_percent']:.1f}%", delta="server load")
@@ -81,8 +90,7 @@ with tab3:
     st.header("Cost Optimization")
     if st.button("🔍 Find Optimal Configuration", type="primary"):
         with st.spinner("Running optimization..."):
-            optimizer = CostOptimizer(lambda_rate, mu_rate, cost_server, cost_waiting)
-            result = optimizer.optimize(c_min=c_min, c_max=c_max)
+            result = _cached_optimize(lambda_rate, mu_rate, cost_server, cost_waiting, c_min, c_max)
             if result['success']:
                 st.success("✅ Optimization Complete!")
                 col1, col2, col3 = st.columns(3)
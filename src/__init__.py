@@ -8,7 +8,8 @@ __author__ = "fergmlx"
 
 from .data_processor import DataProcessor
 from .distribution_fitter import DistributionFitter
-from .queue_models import MMcQueue, QueueSimulator
+from .queue_models import MMcQueue, QueueSimulator, SimResult
+from .queue_math import QMetrics, mmc_metrics
 from .optimizer import CostOptimizer
 
 __all__ = [
@@ -16,5 +17,8 @@ __all__ = [
     'DistributionFitter', 
     'MMcQueue',
     'QueueSimulator',
+    'SimResult',
+    'QMetrics',
+    'mmc_metrics',
     'CostOptimizer'
 ]
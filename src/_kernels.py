@@ -0,0 +1,156 @@
+"""
+Kernels Module
+Funciones numéricas compiladas con numba para los barridos sobre c
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba no disponible: se ejecuta como Python puro
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def sweep_costs(lam, mu, c_min, c_max, cs, cw):
+    """
+    Evalúa Z = c·Cs + Lq·Cw para cada c en [c_min, c_max]
+    
+    Usa la recursión de Pasternack para Erlang-C en un único bucle escalar.
+    Los valores de c inestables (rho >= 1) reciben costo 1e18 y Lq = Wq = inf.
+    
+    Returns:
+    --------
+    tuple
+        (costs, lqs, wqs, rhos) como arrays de tamaño c_max - c_min + 1
+    """
+    n = max(c_max - c_min + 1, 0)
+    costs = np.empty(n)
+    lqs = np.empty(n)
+    wqs = np.empty(n)
+    rhos = np.empty(n)
+    a = lam / mu
+    
+    for idx in range(n):
+        k = c_min + idx
+        rho = a / k
+        rhos[idx] = rho
+        
+        if rho >= 1.0:
+            costs[idx] = 1e18
+            lqs[idx] = np.inf
+            wqs[idx] = np.inf
+            continue
+        
+        V = 1.0 / a
+        for i in range(2, k + 1):
+            V = (i / a) * (V + 1.0)
+        
+        pw = k / (k + (k - a) * V)
+        lq = pw * rho / (1.0 - rho)
+        
+        costs[idx] = k * cs + lq * cw
+        lqs[idx] = lq
+        wqs[idx] = lq / lam
+    
+    return costs, lqs, wqs, rhos
+
+
+@njit(cache=True)
+def simulate_mmc(arrivals, services, c, sim_time):
+    """
+    Simula una cola M/M/c FCFS hasta sim_time
+    
+    Cada servidor guarda el instante en que queda libre; cada llegada se
+    asigna al que se libera primero. Como en FCFS los inicios de servicio
+    son no decrecientes, la longitud de cola vista por cada llegada se
+    obtiene con un puntero sobre esos inicios.
+    
+    Parameters:
+    -----------
+    arrivals : np.ndarray
+        Instantes de llegada crecientes, todos menores que sim_time
+    services : np.ndarray
+        Tiempo de servicio de cada llegada
+    c : int
+        Número de servidores
+    sim_time : float
+        Tiempo de simulación
+    
+    Returns:
+    --------
+    tuple
+        (wait_times, system_times, queue_lengths) como arrays
+    """
+    n = arrivals.size
+    servers = np.zeros(c)
+    starts = np.empty(n)
+    waits = np.empty(n)
+    systs = np.empty(n)
+    qlens = np.empty(n, np.int64)
+    n_wait = 0
+    n_sys = 0
+    head = 0
+    
+    for i in range(n):
+        t = arrivals[i]
+        
+        # Clientes que siguen esperando al momento de la llegada
+        while head < i and starts[head] <= t:
+            head += 1
+        qlens[i] = i - head
+        
+        j = np.argmin(servers)
+        start = t if servers[j] < t else servers[j]
+        finish = start + services[i]
+        servers[j] = finish
+        starts[i] = start
+        
+        if start < sim_time:
+            waits[n_wait] = start - t
+            n_wait += 1
+        if finish < sim_time:
+            systs[n_sys] = finish - t
+            n_sys += 1
+    
+    return waits[:n_wait], systs[:n_sys], qlens
+
+
+@njit(cache=True)
+def describe(x):
+    """
+    Calcula media, desviación estándar (poblacional), mínimo y máximo en una pasada
+    
+    Usa la actualización de Welford para la varianza, que evita la
+    cancelación numérica de s2/n - media².
+    
+    Returns:
+    --------
+    tuple
+        (mean, std, min, max)
+    """
+    if x.size == 0:
+        raise ValueError("zero-size array to reduction operation which has no identity")
+    
+    mean = 0.0
+    m2 = 0.0
+    mn = x[0]
+    mx = x[0]
+    
+    for i in range(x.size):
+        v = x[i]
+        if v != v:
+            # NaN se propaga a todas las estadísticas, como en numpy
+            return np.nan, np.nan, np.nan, np.nan
+        delta = v - mean
+        mean += delta / (i + 1)
+        m2 += delta * (v - mean)
+        if v < mn:
+            mn = v
+        if v > mx:
+            mx = v
+    
+    return mean, np.sqrt(m2 / x.size), mn, mx
@@ -5,7 +5,7 @@ Procesa logs de servidor para análisis de teoría de colas
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from ._kernels import describe
 
 
 class DataProcessor:
@@ -30,7 +30,8 @@ class DataProcessor:
         """
         self.data = pd.read_csv(filepath)
         if 'timestamp' in self.data.columns:
-            self.data['timestamp'] = pd.to_datetime(self.data['timestamp'])
+            self.data['timestamp'] = pd.to_datetime(self.data['timestamp'], cache=True,
+                                                    format='ISO8601')
         return self.data
     
     def calculate_interarrival_times(self, df=None):
@@ -53,13 +54,26 @@ class DataProcessor:
         if 'arrival_time' in df.columns:
             interarrival = np.diff(df['arrival_time'].values)
         elif 'timestamp' in df.columns:
-            timestamps = df['timestamp'].values
-            interarrival = np.diff(timestamps.astype('datetime64[s]').astype(float))
+            diffs = np.diff(df['timestamp'].values)
+            interarrival = diffs / np.timedelta64(1, 's')
         else:
             raise ValueError("DataFrame debe tener columna 'arrival_time' o 'timestamp'")
             
         return interarrival
     
+    @staticmethod
+    def _summarize(values):
+        """Estadísticas descriptivas de un array en una sola pasada (más la mediana)"""
+        values = np.asarray(values, dtype=np.float64)
+        mean, std, vmin, vmax = describe(values)
+        return {
+            'mean': mean,
+            'std': std,
+            'min': vmin,
+            'max': vmax,
+            'median': np.median(values)
+        }
+    
     def get_statistics(self, df=None):
         """
         Calcula estadísticas descriptivas de los datos
@@ -82,27 +96,15 @@ class DataProcessor:
         
         stats = {
             'total_requests': len(df),
-            'interarrival': {
-                'mean': np.mean(interarrival),
-                'std': np.std(interarrival),
-                'min': np.min(interarrival),
-                'max': np.max(interarrival),
-                'median': np.median(interarrival)
-            }
+            'interarrival': self._summarize(interarrival)
         }
         
         if service_times is not None:
-            stats['service_time'] = {
-                'mean': np.mean(service_times),
-                'std': np.std(service_times),
-                'min': np.min(service_times),
-                'max': np.max(service_times),
-                'median': np.median(service_times)
-            }
+            stats['service_time'] = self._summarize(service_times)
             
             # Calcular tasas (λ y μ)
-            lambda_rate = 1 / np.mean(interarrival)
-            mu_rate = 1 / np.mean(service_times)
+            lambda_rate = 1 / stats['interarrival']['mean']
+            mu_rate = 1 / stats['service_time']['mean']
             
             stats['rates'] = {
                 'lambda_per_second': lambda_rate,
@@ -124,20 +126,21 @@ class DataProcessor:
         if 'timestamp' not in df.columns:
             return {'error': 'Se requiere columna timestamp'}
         
-        df = df.copy()
-        df['hour'] = df['timestamp'].dt.hour
-        df['day_of_week'] = df['timestamp'].dt.dayofweek
+        hours = df['timestamp'].dt.hour.dropna().to_numpy(dtype=np.int64)
+        counts = np.bincount(hours, minlength=24)
         
-        hourly_counts = df.groupby('hour').size()
-        peak_hour = hourly_counts.idxmax()
-        low_hour = hourly_counts.idxmin()
+        # Solo horas con al menos una solicitud
+        observed_hours = np.flatnonzero(counts)
+        hourly_counts = counts[observed_hours]
+        peak_idx = hourly_counts.argmax()
+        low_idx = hourly_counts.argmin()
         
         patterns = {
-            'peak_hour': int(peak_hour),
-            'peak_hour_requests': int(hourly_counts.max()),
-            'low_hour': int(low_hour),
-            'low_hour_requests': int(hourly_counts.min()),
-            'hourly_distribution': hourly_counts.to_dict(),
+            'peak_hour': int(observed_hours[peak_idx]),
+            'peak_hour_requests': int(hourly_counts[peak_idx]),
+            'low_hour': int(observed_hours[low_idx]),
+            'low_hour_requests': int(hourly_counts[low_idx]),
+            'hourly_distribution': dict(zip(observed_hours.tolist(), hourly_counts.tolist())),
             'peak_to_average_ratio': hourly_counts.max() / hourly_counts.mean()
         }
         
@@ -159,11 +162,12 @@ class DataProcessor:
         
         service_times = np.random.exponential(1/mu_sec, n_requests)
         
+        # Timestamps vectorizados con resolución de microsegundos (conserva la zona horaria)
         start = pd.to_datetime(start_date)
-        timestamps = [start + timedelta(seconds=float(t)) for t in arrival_times]
+        timestamps = start + pd.to_timedelta(np.round(arrival_times * 1e6), unit='us')
         
         df = pd.DataFrame({
-            'request_id': range(1, n_requests + 1),
+            'request_id': np.arange(1, n_requests + 1, dtype=np.int32),
             'arrival_time': arrival_times,
             'service_time': service_times,
             'timestamp': timestamps
@@ -3,12 +3,39 @@ Distribution Fitter Module
 Ajusta distribuciones estadísticas a datos de teoría de colas
 """
 
+import hashlib
+
 import numpy as np
 from scipy import stats
 import warnings
 warnings.filterwarnings('ignore')
 
 
+_DIST_CACHE = {name: getattr(stats, name)
+               for name in ('expon', 'gamma', 'lognorm', 'weibull_min')}
+
+
+# Grillas fijas para Q-Q plots: cuantiles teóricos y percentiles muestrales
+_QQ_PROBS = np.linspace(0.01, 0.99, 100)
+_QQ_PERCENTILES = np.linspace(1, 99, 100)
+
+
+# Ajustes ya calculados: (hash de los datos, distribución) -> resultado
+_FIT_CACHE = {}
+_FIT_CACHE_MAXSIZE = 128
+
+
+def _get_dist(dist_name):
+    """Retorna la distribución de scipy.stats, usando la caché si existe"""
+    return _DIST_CACHE.get(dist_name) or getattr(stats, dist_name)
+
+
+def _data_key(data):
+    """Hash estable del contenido de los datos"""
+    buffer = np.ascontiguousarray(data, dtype=np.float64).tobytes()
+    return hashlib.blake2b(buffer, digest_size=8).hexdigest()
+
+
 class DistributionFitter:
     """Ajusta distribuciones estadísticas a los datos"""
     
@@ -19,6 +46,9 @@ class DistributionFitter:
         """
         Ajusta múltiples distribuciones a los datos
         
+        Los ajustes se reutilizan si los mismos datos ya fueron ajustados a
+        la misma distribución (p. ej. en re-ejecuciones del dashboard).
+        
         Parameters:
         -----------
         data : array-like
@@ -32,14 +62,20 @@ class DistributionFitter:
             Diccionario con parámetros ajustados para cada distribución
         """
         results = {}
+        data_key = _data_key(data)
         
         for dist_name in distributions:
+            cached = _FIT_CACHE.get((data_key, dist_name))
+            if cached is not None:
+                results[dist_name] = dict(cached)
+                continue
+            
             try:
-                dist = getattr(stats, dist_name)
+                dist = _get_dist(dist_name)
                 params = dist.fit(data)
                 
                 # Calcular log-likelihood para AIC/BIC
-                log_likelihood = np.sum(dist.logpdf(data, *params))
+                log_likelihood = dist.logpdf(data, *params).sum()
                 k = len(params)
                 n = len(data)
                 
@@ -53,6 +89,10 @@ class DistributionFitter:
                     'aic': aic,
                     'bic': bic
                 }
+                
+                if len(_FIT_CACHE) >= _FIT_CACHE_MAXSIZE:
+                    _FIT_CACHE.pop(next(iter(_FIT_CACHE)))
+                _FIT_CACHE[(data_key, dist_name)] = dict(results[dist_name])
             except Exception as e:
                 print(f"Error fitting {dist_name}: {e}")
                 
@@ -78,7 +118,7 @@ class DistributionFitter:
             Resultados de los tests K-S y Chi-cuadrado
         """
         if isinstance(distribution, str):
-            dist = getattr(stats, distribution)
+            dist = _get_dist(distribution)
         else:
             dist = distribution
             
@@ -87,12 +127,7 @@ class DistributionFitter:
         
         # Test Chi-cuadrado
         observed, bin_edges = np.histogram(data, bins=20)
-        expected = []
-        for i in range(len(bin_edges) - 1):
-            expected.append(
-                (dist.cdf(bin_edges[i+1], *params) - dist.cdf(bin_edges[i], *params)) * len(data)
-            )
-        expected = np.array(expected)
+        expected = np.diff(dist.cdf(bin_edges, *params)) * len(data)
         
         # Filtrar bins vacíos
         mask = expected > 5
@@ -158,14 +193,17 @@ class DistributionFitter:
         if distribution is None:
             distribution, params, _ = self.get_best_distribution(data)
             
-        dist = getattr(stats, distribution)
+        dist = _get_dist(distribution)
+        
+        data_sorted = np.sort(data)
+        n = data_sorted.size
         
-        # Q-Q plot data
-        theoretical_quantiles = dist.ppf(np.linspace(0.01, 0.99, 100), *params)
-        sample_quantiles = np.percentile(data, np.linspace(1, 99, 100))
+        # Q-Q plot data (percentiles por interpolación lineal, como np.percentile)
+        theoretical_quantiles = dist.ppf(_QQ_PROBS, *params)
+        sample_quantiles = np.interp(_QQ_PERCENTILES / 100 * (n - 1), np.arange(n), data_sorted)
         
         # PDF comparison
-        x = np.linspace(data.min(), data.max(), 1000)
+        x = np.linspace(data_sorted[0], data_sorted[-1], 1000)
         pdf_fitted = dist.pdf(x, *params)
         
         return {
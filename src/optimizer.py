@@ -3,9 +3,100 @@ Cost Optimizer Module
 Optimiza número de servidores minimizando costos totales
 """
 
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+from functools import lru_cache, wraps
+from pathlib import Path
+
 import numpy as np
 from scipy.optimize import minimize_scalar, differential_evolution
 from .queue_models import MMcQueue
+from .queue_math import mmc_metrics
+from ._kernels import sweep_costs
+
+
+# Métricas M/M/c memoizadas por (lambda, mu, c)
+_mmc_metrics = lru_cache(maxsize=4096)(mmc_metrics)
+
+# Caché en disco opcional: solo se activa si esta variable apunta a un directorio
+DISK_CACHE_ENV = 'IO_COLAS_CACHE_DIR'
+
+# Módulos cuyas fórmulas determinan el resultado de optimize
+_CACHE_SOURCES = ('optimizer.py', 'queue_models.py', 'queue_math.py', '_kernels.py')
+
+
+@lru_cache(maxsize=1)
+def _cache_version():
+    """Hash del código fuente del modelo; invalida la caché si cambia alguna fórmula"""
+    digest = hashlib.blake2b(digest_size=8)
+    for name in _CACHE_SOURCES:
+        digest.update((Path(__file__).parent / name).read_bytes())
+    return digest.hexdigest()
+
+
+def _disk_cached(method):
+    """
+    Persiste en disco el resultado de un método determinista
+    
+    Desactivado por defecto. Si la variable de entorno IO_COLAS_CACHE_DIR
+    está definida, los resultados se guardan como pickle en
+    <IO_COLAS_CACHE_DIR>/optimizer/<hash>.pkl. La clave combina la versión
+    del código, el nombre del método, los atributos de la instancia y los
+    argumentos (con valores por defecto aplicados).
+    """
+    signature = inspect.signature(method)
+    
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache_root = os.environ.get(DISK_CACHE_ENV)
+        if not cache_root:
+            return method(self, *args, **kwargs)
+        
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        del arguments['self']
+        
+        # Sin versión del código no hay clave segura: se calcula sin caché
+        try:
+            version = _cache_version()
+        except OSError:
+            return method(self, *args, **kwargs)
+        
+        key = repr((version, method.__qualname__,
+                    sorted(vars(self).items()), sorted(arguments.items())))
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        path = Path(cache_root) / 'optimizer' / f"{digest}.pkl"
+        
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            # Archivo ausente, corrupto o escrito por otra versión: se recalcula
+            pass
+        
+        result = method(self, *args, **kwargs)
+        
+        # Escritura atómica; si el disco no es escribible se omite la caché
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(result, f)
+                os.replace(tmp_path, path)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+        
+        return result
+    
+    return wrapper
 
 
 class CostOptimizer:
@@ -51,23 +142,37 @@ class CostOptimizer:
         if c <= 0:
             return 1e10
         
-        queue = MMcQueue(self.lambda_rate, self.mu_rate, c)
-        
-        if not queue.is_stable():
-            return 1e10
-        
-        metrics = queue.calculate_metrics()
+        metrics = _mmc_metrics(self.lambda_rate, self.mu_rate, c)
         
-        if not metrics['stable']:
+        if not metrics.stable:
             return 1e10
         
-        lq = metrics['Lq']
+        lq = metrics.Lq
         
         # Costo total = Costo de servidores + Costo de espera
         total_cost = c * self.cost_server + lq * self.cost_waiting
         
         return total_cost
     
+    def _sweep(self, c_min, c_max):
+        """
+        Evalúa costos y métricas para todos los c estables en [c_min, c_max]
+        
+        Returns:
+        --------
+        tuple
+            (c_values, costs, lqs, wqs, rhos) como arrays de numpy
+        """
+        costs, lqs, wqs, rhos = sweep_costs(
+            float(self.lambda_rate), float(self.mu_rate), int(c_min), int(c_max),
+            float(self.cost_server), float(self.cost_waiting)
+        )
+        c_values = np.arange(c_min, c_min + costs.size)
+        
+        stable = rhos < 1
+        return c_values[stable], costs[stable], lqs[stable], wqs[stable], rhos[stable]
+    
+    @_disk_cached
     def optimize(self, c_min=1, c_max=50, sla_wq=None):
         """
         Encuentra el número óptimo de servidores
@@ -90,47 +195,40 @@ class CostOptimizer:
         c_stability = int(np.ceil(self.lambda_rate / self.mu_rate)) + 1
         c_min = max(c_min, c_stability)
         
-        best_c = None
-        best_cost = np.inf
-        best_metrics = None
-        
-        # Evaluar todos los valores enteros de c
-        results = []
+        c_values, costs, lqs, wqs, rhos = self._sweep(c_min, c_max)
         
-        for c in range(c_min, c_max + 1):
-            queue = MMcQueue(self.lambda_rate, self.mu_rate, c)
-            
-            if not queue.is_stable():
-                continue
-            
-            metrics = queue.calculate_metrics()
-            
-            # Verificar restricción SLA si existe
-            if sla_wq is not None and metrics['Wq'] > sla_wq:
-                continue
-            
-            cost = self.objective_function(c)
-            
-            results.append({
-                'c': c,
-                'cost': cost,
-                'Lq': metrics['Lq'],
-                'Wq': metrics['Wq'],
-                'rho': metrics['rho'],
-                'meets_sla': metrics['Wq'] <= sla_wq if sla_wq else True
-            })
-            
-            if cost < best_cost:
-                best_cost = cost
-                best_c = c
-                best_metrics = metrics
+        # Verificar restricción SLA si existe
+        if sla_wq is not None:
+            feasible = wqs <= sla_wq
+            c_values, costs, lqs, wqs, rhos = (
+                c_values[feasible], costs[feasible], lqs[feasible],
+                wqs[feasible], rhos[feasible]
+            )
         
-        if best_c is None:
+        if c_values.size == 0:
             return {
                 'success': False,
                 'message': 'No se encontró solución factible'
             }
         
+        results = [
+            {
+                'c': int(c),
+                'cost': float(cost),
+                'Lq': float(lq),
+                'Wq': float(wq),
+                'rho': float(rho),
+                'meets_sla': bool(wq <= sla_wq) if sla_wq else True
+            }
+            for c, cost, lq, wq, rho in zip(c_values, costs, lqs, wqs, rhos)
+        ]
+        
+        best_idx = int(np.argmin(costs))
+        best_c = int(c_values[best_idx])
+        best_cost = float(costs[best_idx])
+        
+        best_metrics = MMcQueue(self.lambda_rate, self.mu_rate, best_c).calculate_metrics()
+        
         return {
             'success': True,
             'optimal_c': best_c,
@@ -162,41 +260,23 @@ class CostOptimizer:
         
         c_min, c_max = c_range
         
+        c_values, costs, lqs, wqs, rhos = self._sweep(c_min, c_max)
+        
         results = {
-            'c_values': [],
-            'total_costs': [],
-            'server_costs': [],
-            'waiting_costs': [],
-            'utilizations': [],
-            'wq_values': [],
-            'lq_values': []
+            'c_values': c_values.tolist(),
+            'total_costs': costs.tolist(),
+            'server_costs': (c_values * self.cost_server).tolist(),
+            'waiting_costs': (lqs * self.cost_waiting).tolist(),
+            'utilizations': rhos.tolist(),
+            'wq_values': wqs.tolist(),
+            'lq_values': lqs.tolist()
         }
         
-        for c in range(c_min, c_max + 1):
-            queue = MMcQueue(self.lambda_rate, self.mu_rate, c)
-            
-            if not queue.is_stable():
-                continue
-            
-            metrics = queue.calculate_metrics()
-            
-            server_cost = c * self.cost_server
-            waiting_cost = metrics['Lq'] * self.cost_waiting
-            total_cost = server_cost + waiting_cost
-            
-            results['c_values'].append(c)
-            results['total_costs'].append(total_cost)
-            results['server_costs'].append(server_cost)
-            results['waiting_costs'].append(waiting_cost)
-            results['utilizations'].append(metrics['rho'])
-            results['wq_values'].append(metrics['Wq'])
-            results['lq_values'].append(metrics['Lq'])
-        
         # Encontrar óptimo
-        if results['total_costs']:
-            min_idx = np.argmin(results['total_costs'])
-            results['optimal_c'] = results['c_values'][min_idx]
-            results['optimal_cost'] = results['total_costs'][min_idx]
+        if c_values.size:
+            min_idx = int(np.argmin(costs))
+            results['optimal_c'] = int(c_values[min_idx])
+            results['optimal_cost'] = float(costs[min_idx])
         
         return results
     
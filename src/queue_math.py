@@ -0,0 +1,93 @@
+"""
+Queue Math Module
+Fórmulas cerradas del modelo M/M/c como funciones libres
+"""
+
+import math
+from collections import namedtuple
+
+
+QMetrics = namedtuple('QMetrics', 'stable rho P0 Pw Lq L Wq W')
+
+
+def erlang_c(a, c, rho):
+    """
+    Calcula P0 (sistema vacío) y Pw (Erlang-C) en un solo bucle
+    
+    Usa la recursión de Pasternack V(a,k) = (k/a)·(V(a,k-1) + 1),
+    con V = 1/B(a,k) - 1 (B = Erlang-B), para evitar factoriales y
+    potencias grandes que desbordan con muchos servidores.
+    
+    Parameters:
+    -----------
+    a : float
+        Intensidad de tráfico lambda/mu
+    c : int
+        Número de servidores
+    rho : float
+        Utilización a/c (debe ser < 1)
+        
+    Returns:
+    --------
+    tuple
+        (P0, Pw)
+    
+    Examples:
+    ---------
+    Muchos servidores y poco tráfico: V desborda y P0 tiende a e^(-a)
+    
+    >>> p0, pw = erlang_c(0.01, 100, 0.0001)
+    >>> round(p0, 6), pw
+    (0.99005, 0.0)
+    """
+    V = 1.0 / a
+    for k in range(2, c + 1):
+        V = (k / a) * (V + 1.0)
+    
+    pw = c / (c + (c - a) * V)
+    
+    # Con B(a,c) = 1/(1+V) < 1e-16 el término a^c/c! es despreciable frente a
+    # la serie y P0 = e^(-a) a precisión de máquina (evita log(0) si V = inf)
+    if not math.isfinite(V) or V > 1e16:
+        return math.exp(-a), pw
+    
+    # P0 = Pw·(1 - rho) / (a^c / c!), con a^c / c! evaluado en escala log
+    log_term = c * math.log(a) - math.lgamma(c + 1)
+    p0 = math.exp(math.log(pw) + math.log(1 - rho) - log_term)
+    return p0, pw
+
+
+def mmc_metrics(lam, mu, c):
+    """
+    Calcula las métricas del sistema M/M/c
+    
+    Parameters:
+    -----------
+    lam : float
+        Tasa de llegada
+    mu : float
+        Tasa de servicio por servidor
+    c : int
+        Número de servidores
+        
+    Returns:
+    --------
+    QMetrics
+        stable, rho, P0, Pw (Erlang-C), Lq, L, Wq, W. Si el sistema es
+        inestable (rho >= 1) las métricas son NaN
+    """
+    rho = lam / (c * mu)
+    
+    if rho >= 1:
+        nan = float('nan')
+        return QMetrics(False, rho, nan, nan, nan, nan, nan, nan)
+    
+    p0, pw = erlang_c(lam / mu, c, rho)
+    
+    # Lq, Wq, L, W (Ley de Little)
+    lq = pw * rho / (1 - rho)
+    wq = lq / lam
+    l = lq + lam / mu
+    w = wq + 1 / mu
+    
+    return QMetrics(True, rho, p0, pw, lq, l, wq, w)
@@ -3,10 +3,11 @@ Queue Models Module
 Implementa modelos de teoría de colas M/M/c y simulación
 """
 
+from dataclasses import dataclass
+
 import numpy as np
-from scipy.special import factorial
-from scipy.stats import expon
-import simpy
+from ._kernels import simulate_mmc
+from .queue_math import mmc_metrics
 
 
 class MMcQueue:
@@ -34,19 +35,6 @@ class MMcQueue:
         """Verifica si el sistema es estable (rho < 1)"""
         return self.rho < 1
     
-    def _calculate_p0(self):
-        """Calcula probabilidad de 0 clientes en el sistema"""
-        c = self.c
-        lam = self.lambda_rate
-        mu = self.mu_rate
-        rho = self.rho
-        
-        sum_term = sum([(lam/mu)**n / factorial(n) for n in range(c)])
-        last_term = (lam/mu)**c / factorial(c) * (1 / (1 - rho))
-        
-        p0 = 1 / (sum_term + last_term)
-        return p0
-    
     def calculate_metrics(self):
         """
         Calcula todas las métricas del sistema M/M/c
@@ -56,54 +44,47 @@ class MMcQueue:
         dict
             Diccionario con L, Lq, W, Wq, rho, P0, Pw (Erlang-C)
         """
-        if not self.is_stable():
+        m = mmc_metrics(self.lambda_rate, self.mu_rate, self.c)
+        
+        if not m.stable:
             return {
                 'stable': False,
-                'rho': self.rho,
+                'rho': m.rho,
                 'message': 'Sistema inestable: rho >= 1'
             }
         
-        c = self.c
-        lam = self.lambda_rate
-        mu = self.mu_rate
-        rho = self.rho
-        
-        # P0: Probabilidad de sistema vacío
-        p0 = self._calculate_p0()
-        
-        # Pw (Erlang-C): Probabilidad de esperar en cola
-        pw = ((lam/mu)**c / factorial(c)) * (1 / (1 - rho)) * p0
-        
-        # Lq: Número promedio en cola
-        lq = pw * rho / (1 - rho)
-        
-        # Wq: Tiempo promedio en cola
-        wq = lq / lam
-        
-        # L: Número promedio en sistema
-        l = lq + lam / mu
-        
-        # W: Tiempo promedio en sistema
-        w = wq + 1 / mu
-        
         return {
             'stable': True,
-            'rho': rho,
-            'utilization_percent': rho * 100,
-            'P0': p0,
-            'Pw_erlang_c': pw,
-            'Lq': lq,
-            'L': l,
-            'Wq': wq,
-            'W': w,
-            'lambda': lam,
-            'mu': mu,
-            'c': c
+            'rho': m.rho,
+            'utilization_percent': m.rho * 100,
+            'P0': m.P0,
+            'Pw_erlang_c': m.Pw,
+            'Lq': m.Lq,
+            'L': m.L,
+            'Wq': m.Wq,
+            'W': m.W,
+            'lambda': self.lambda_rate,
+            'mu': self.mu_rate,
+            'c': self.c
         }
 
 
+@dataclass
+class SimResult:
+    """Resultados de una simulación: métricas empíricas y trayectorias como arrays"""
+    wait_times: np.ndarray
+    system_times: np.ndarray
+    queue_lengths: np.ndarray
+    Wq: float
+    W: float
+    Lq: float
+    L: float
+    total_customers: int
+    sim_time: float
+
+
 class QueueSimulator:
-    """Simulación de cola usando SimPy (Monte Carlo)"""
+    """Simulación de cola M/M/c FCFS (Monte Carlo)"""
     
     def __init__(self, lambda_rate, mu_rate, c_servers, sim_time=10000):
         """
@@ -125,39 +106,21 @@ class QueueSimulator:
         self.c_servers = c_servers
         self.sim_time = sim_time
         
-        self.wait_times = []
-        self.system_times = []
-        self.queue_lengths = []
+        self.wait_times = np.empty(0)
+        self.system_times = np.empty(0)
+        self.queue_lengths = np.empty(0, dtype=np.int64)
+    
+    def _draw_arrivals(self, rng):
+        """Genera los instantes de llegada Poisson anteriores a sim_time"""
+        # Lote inicial holgado (~2·λ·T); se amplía solo si no alcanza sim_time
+        n_est = int(2 * self.lambda_rate * self.sim_time) + 64
+        arrivals = np.cumsum(rng.exponential(1 / self.lambda_rate, n_est))
         
-    def customer(self, env, name, server, arrival_time):
-        """Proceso de un cliente en el sistema"""
-        arrive = env.now
+        while arrivals[-1] < self.sim_time:
+            extra = np.cumsum(rng.exponential(1 / self.lambda_rate, n_est))
+            arrivals = np.concatenate([arrivals, arrivals[-1] + extra])
         
-        with server.request() as req:
-            yield req
-            
-            wait = env.now - arrive
-            self.wait_times.append(wait)
-            
-            service_time = expon.rvs(scale=1/self.mu_rate)
-            yield env.timeout(service_time)
-            
-            system_time = env.now - arrive
-            self.system_times.append(system_time)
-    
-    def customer_generator(self, env, server):
-        """Genera llegadas de clientes siguiendo proceso Poisson"""
-        customer_count = 0
-        while True:
-            interarrival = expon.rvs(scale=1/self.lambda_rate)
-            yield env.timeout(interarrival)
-            
-            customer_count += 1
-            env.process(self.customer(env, f'Customer{customer_count}', 
-                                      server, env.now))
-            
-            # Registrar longitud de cola
-            self.queue_lengths.append(len(server.queue))
+        return arrivals[:np.searchsorted(arrivals, self.sim_time)]
     
     def run_simulation(self, seed=42):
         """
@@ -170,16 +133,16 @@ class QueueSimulator:
             
         Returns:
         --------
-        dict
-            Métricas empíricas de la simulación
+        SimResult
+            Métricas empíricas y trayectorias de la simulación
         """
-        np.random.seed(seed)
+        rng = np.random.default_rng(seed)
+        arrivals = self._draw_arrivals(rng)
+        services = rng.exponential(1 / self.mu_rate, arrivals.size)
         
-        env = simpy.Environment()
-        server = simpy.Resource(env, capacity=self.c_servers)
-        
-        env.process(self.customer_generator(env, server))
-        env.run(until=self.sim_time)
+        self.wait_times, self.system_times, self.queue_lengths = simulate_mmc(
+            arrivals, services, int(self.c_servers), float(self.sim_time)
+        )
         
         # Calcular métricas empíricas
         wq_sim = np.mean(self.wait_times)
@@ -187,14 +150,14 @@ class QueueSimulator:
         lq_sim = np.mean(self.queue_lengths)
         l_sim = lq_sim + self.lambda_rate / self.mu_rate
         
-        return {
-            'Wq_simulated': wq_sim,
-            'W_simulated': w_sim,
-            'Lq_simulated': lq_sim,
-            'L_simulated': l_sim,
-            'total_customers': len(self.wait_times),
-            'sim_time': self.sim_time,
-            'wait_times': self.wait_times,
-            'system_times': self.system_times,
-            'queue_lengths': self.queue_lengths
-        }
+        return SimResult(
+            wait_times=self.wait_times,
+            system_times=self.system_times,
+            queue_lengths=self.queue_lengths,
+            Wq=float(wq_sim),
+            W=float(w_sim),
+            Lq=float(lq_sim),
+            L=float(l_sim),
+            total_customers=len(self.wait_times),
+            sim_time=self.sim_time
+        )
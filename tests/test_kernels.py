@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from src._kernels import describe
+
+
+def test_describe_matches_numpy():
+    x = np.random.default_rng(0).exponential(30.0, 10_000)
+    mean, std, vmin, vmax = describe(x)
+    assert mean == pytest.approx(np.mean(x))
+    assert std == pytest.approx(np.std(x))
+    assert vmin == np.min(x)
+    assert vmax == np.max(x)
+
+
+def test_describe_single_value():
+    assert describe(np.array([2.5])) == (2.5, 0.0, 2.5, 2.5)
+
+
+@pytest.mark.parametrize('values', [[1.0, np.nan, 3.0], [np.nan, 1.0], [1.0, 3.0, np.nan]])
+def test_describe_propagates_nan(values):
+    assert all(np.isnan(v) for v in describe(np.array(values)))
+
+
+def test_describe_empty_raises_value_error():
+    with pytest.raises(ValueError):
+        describe(np.empty(0))